@@ -6,10 +6,13 @@ from .models import (
     Feed, FeedType, Entities, HashtagEntity, MentionEntity, UrlEntity,
     PublicMetrics, ReferencedFeed, ReferencedFeedType, User
 )
-from .utils import extract_entities, generate_feed_id, save_feed, load_feed
+from .utils import (
+    extract_entities, generate_feed_id, save_feed, load_feed, save_feeds, load_feeds
+)
 
 __all__ = [
     "Feed", "FeedType", "Entities", "HashtagEntity", "MentionEntity", "UrlEntity",
     "PublicMetrics", "ReferencedFeed", "ReferencedFeedType", "User",
-    "extract_entities", "generate_feed_id", "save_feed", "load_feed"
+    "extract_entities", "generate_feed_id", "save_feed", "load_feed",
+    "save_feeds", "load_feeds"
 ]
@@ -1,12 +1,17 @@
 """Twitter Feed data models powered by Pydantic"""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
+def _utcnow_iso() -> str:
+    """Current UTC time as ISO 8601 with a Z suffix"""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 class FeedType(str, Enum):
     POST = "post"
     REPLY = "reply"
@@ -79,7 +84,7 @@ class Feed(BaseModel):
     id: str
     text: str
     author_id: str
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    created_at: str = Field(default_factory=_utcnow_iso)
     feed_type: FeedType = FeedType.POST
     conversation_id: Optional[str] = None
     in_reply_to_user_id: Optional[str] = None
@@ -98,4 +103,4 @@ class Feed(BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Feed":
-        return cls(**data)
+        return cls.model_validate(data)
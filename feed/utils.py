@@ -3,36 +3,57 @@
 import json
 import re
 import hashlib
-from datetime import datetime
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from .models import Feed, Entities, HashtagEntity, MentionEntity, UrlEntity
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
 
 def generate_feed_id() -> str:
     """Generate unique feed ID from timestamp"""
-    return str(int(datetime.utcnow().timestamp() * 1000000))
+    return str(time.time_ns() // 1000)
+
+
+@lru_cache(maxsize=65536)
+def _mention_id(username: str) -> str:
+    """Derive a stable mention ID from a username"""
+    return hashlib.sha256(username.encode()).hexdigest()[:16]
 
 
 def extract_entities(text: str) -> Optional[Entities]:
     """Extract hashtags, mentions, URLs from text"""
     entities = Entities()
     
-    for match in re.finditer(r'#(\w+)', text):
+    for match in _HASHTAG_RE.finditer(text):
         entities.hashtags.append(HashtagEntity(
             start=match.start(), end=match.end(), tag=match.group(1)
         ))
     
-    for match in re.finditer(r'@(\w+)', text):
+    for match in _MENTION_RE.finditer(text):
         entities.mentions.append(MentionEntity(
             start=match.start(), end=match.end(), username=match.group(1),
-            id=hashlib.sha256(match.group(1).encode()).hexdigest()[:16]
+            id=_mention_id(match.group(1))
         ))
     
-    for match in re.finditer(r'https?://[^\s<>"{}|\\^`\[\]]+', text):
+    for match in _URL_RE.finditer(text):
         url = match.group()
-        display = url.replace("https://", "").replace("http://", "")
+        display = url[8:] if url.startswith("https://") else url[7:]
         entities.urls.append(UrlEntity(
             start=match.start(), end=match.end(), url=url, expanded_url=url,
             display_url=display if len(display) <= 30 else display[:27] + "..."
@@ -41,16 +62,65 @@ def extract_entities(text: str) -> Optional[Entities]:
     return entities if (entities.hashtags or entities.mentions or entities.urls) else None
 
 
-def save_feed(feed: Feed, filepath: str) -> str:
-    """Save feed to JSON file"""
+def _dumps(data: Dict[str, Any], indent: bool = True) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Decode JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _require_msgspec() -> None:
+    """Raise a helpful error when the msgpack extra is missing"""
+    if msgspec is None:
+        raise ImportError("MessagePack support requires msgspec: pip install 'feed[msgpack]'")
+
+
+def save_feed(feed: Feed, filepath: str, pretty: bool = True) -> str:
+    """Save feed to JSON file, or MessagePack if the path ends in .msgpack
+
+    pretty only affects JSON output; MessagePack is a binary format and ignores it.
+    """
     path = Path(filepath)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(feed.to_dict(), f, indent=2, ensure_ascii=False)
+    if path.suffix == '.msgpack':
+        _require_msgspec()
+        path.write_bytes(msgspec.msgpack.encode(feed.to_dict()))
+    else:
+        path.write_bytes(_dumps(feed.to_dict(), indent=pretty))
     return str(path.absolute())
 
 
 def load_feed(filepath: str) -> Feed:
-    """Load feed from JSON file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return Feed.from_dict(json.load(f))
+    """Load feed from JSON file, or MessagePack if the path ends in .msgpack"""
+    path = Path(filepath)
+    if path.suffix == '.msgpack':
+        _require_msgspec()
+        return Feed.from_dict(msgspec.msgpack.decode(path.read_bytes()))
+    return Feed.from_dict(_loads(path.read_bytes()))
+
+
+def save_feeds(feeds: Iterable[Feed], filepath: str, append: bool = False) -> str:
+    """Save feeds to a JSON Lines file, one feed per line; append=True adds to an existing file"""
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'ab' if append else 'wb') as f:
+        for feed in feeds:
+            f.write(_dumps(feed.to_dict(), indent=False) + b'\n')
+    return str(path.absolute())
+
+
+def load_feeds(filepath: str) -> Iterator[Feed]:
+    """Stream feeds from a JSON Lines file"""
+    with open(filepath, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield Feed.from_dict(_loads(line))